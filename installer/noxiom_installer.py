@@ -3,7 +3,7 @@
 noxiom_installer.py — NOXIOM OS GUI Installer
 
 Single-file installer using stdlib only (tkinter, urllib, subprocess,
-threading, tempfile, os, platform, ctypes, logging).
+threading, tempfile, os, platform, ctypes, logging, ssl).
 
 Usage:
   Windows : python noxiom_installer.py   (must run as Administrator)
@@ -11,7 +11,9 @@ Usage:
   macOS   : sudo python3 noxiom_installer.py
 
 Robustness features:
-  - Download retried up to 3 times with exponential back-off
+  - Image streamed straight from GitHub to the drive (no temp file)
+  - Dropped downloads resume via HTTP Range (3 retries, exponential back-off)
+  - Downloads split over parallel Range requests when the server allows
   - Cancel button available throughout download + write
   - Drive size checked against image size before writing
   - Windows volumes locked/dismounted via FindFirstVolumeW (catches
@@ -27,16 +29,36 @@ Robustness features:
 import os
 import sys
 import json
+import collections
+import concurrent.futures
+import errno
+import functools
+import http.client
 import logging
+import mmap
 import platform
+import queue
+import ssl
 import subprocess
 import tempfile
 import threading
 import time
+import urllib.error
+import urllib.parse
 import urllib.request
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+# ── Platform ──────────────────────────────────────────────────────────────────
+# Resolved once: platform.system() can shell out to `uname` on some hosts.
+SYSTEM = platform.system()
+
+if SYSTEM == "Windows":
+    import ctypes
+    from ctypes import wintypes
+else:
+    import pwd
+
 # ── GitHub release settings ──────────────────────────────────────────────────
 GITHUB_OWNER = "sintaxsaint"
 GITHUB_REPO  = "noxiom"
@@ -44,14 +66,38 @@ API_URL = (
     f"https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}"
     f"/releases?per_page=10"
 )
+GRAPHQL_URL = "https://api.github.com/graphql"   # used when GITHUB_TOKEN is set
 ASSET_X86   = "noxiom-x86_64.img"
 ASSET_ARM64 = "noxiom-arm64.img"
+# Image downloads are only accepted from these hosts (and their subdomains).
+ASSET_HOSTS = ("github.com", "githubusercontent.com")
+# ETag + body of the last REST release listing, revalidated on each start.
+# Kept in a private per-user directory, not the shared temp directory: the
+# installer runs as root / Administrator, and any local user could plant a
+# release list there pointing at their own image.  On Unix the home comes
+# from the effective uid, not $HOME: sudo often keeps the invoking user's
+# HOME, and a root-owned ~/.cache there would break that user's own tools.
+if SYSTEM == "Windows":
+    CACHE_DIR = os.path.join(os.environ.get("LOCALAPPDATA")
+                             or tempfile.gettempdir(), "noxiom")
+else:
+    CACHE_DIR = os.path.join(pwd.getpwuid(os.geteuid()).pw_dir,
+                             ".cache", "noxiom")
+RELEASE_CACHE = os.path.join(CACHE_DIR, "release.json")
 
 # ── Tuning ────────────────────────────────────────────────────────────────────
-CHUNK            = 4 * 1024 * 1024   # 4 MB I/O chunk
-DOWNLOAD_RETRIES = 3                 # max download attempts
-DOWNLOAD_TIMEOUT = 60                # seconds per HTTP request
-SPEED_WINDOW     = 3.0               # seconds of history for speed average
+SECTOR            = 4096              # write alignment (4K-native and 512e drives)
+WRITE_CHUNK       = 8 * 1024 * 1024   # max device write; NOXIOM_WRITE_CHUNK overrides
+MAX_WRITE_CHUNK   = 16 * 1024 * 1024  # upper bound for that override
+DOWNLOAD_CHUNK    = 1024 * 1024       # network read size (device writes: WRITE_CHUNK)
+PIPELINE_DEPTH    = 6                 # chunks buffered between download and write
+DOWNLOAD_STREAMS  = 4                 # parallel range requests per download
+WRITE_QUEUE_DEPTH = 2                 # device writes in flight at once
+DOWNLOAD_RETRIES  = 3                 # max download attempts
+DOWNLOAD_TIMEOUT  = 60                # seconds per HTTP request
+SPEED_WINDOW      = 3.0               # seconds of history for speed average
+PROGRESS_INTERVAL = 0.1               # min seconds between progress-bar updates
+DRIVE_CACHE_TTL   = 2.0               # seconds a Linux drive scan is reused
 
 # ── Logging ───────────────────────────────────────────────────────────────────
 LOG_PATH = os.path.join(tempfile.gettempdir(), "noxiom_installer.log")
@@ -63,6 +109,32 @@ logging.basicConfig(
 )
 log = logging.getLogger("noxiom")
 
+
+# ── Environment overrides ─────────────────────────────────────────────────────
+def _write_chunk_override(default):
+    """
+    NOXIOM_WRITE_CHUNK in bytes, or default if unset or not an integer.
+    Larger USB transfers help up to ~8 MB; above 16 MB some Linux kernels run
+    out of swiotlb bounce buffers, and PIPELINE_DEPTH buffers of this size
+    are allocated up front.  Clamped to SECTOR … MAX_WRITE_CHUNK and rounded
+    down to a whole number of sectors.
+    """
+    raw = os.environ.get("NOXIOM_WRITE_CHUNK")
+    if not raw:
+        return default
+    try:
+        size = int(raw)
+    except ValueError:
+        log.warning(f"Ignoring NOXIOM_WRITE_CHUNK={raw!r}: not a byte count")
+        return default
+    size = min(MAX_WRITE_CHUNK, max(SECTOR, size))
+    size -= size % SECTOR
+    log.info(f"Write chunk from NOXIOM_WRITE_CHUNK: {size} bytes")
+    return size
+
+
+WRITE_CHUNK = _write_chunk_override(WRITE_CHUNK)
+
 # ── UI theme ──────────────────────────────────────────────────────────────────
 C_BG     = "#0d1117"
 C_BG2    = "#161b22"
@@ -100,11 +172,12 @@ def _win_err(code):
 
 
 # ── Admin check ───────────────────────────────────────────────────────────────
+# Cached: the token can't gain or lose elevation while the process runs, and
+# main() and App both ask.
+@functools.lru_cache(maxsize=None)
 def is_admin():
     try:
-        if platform.system() == "Windows":
-            import ctypes
-            import ctypes.wintypes
+        if SYSTEM == "Windows":
             # IsUserAnAdmin() checks group membership on the *original* token and
             # returns False for elevated processes in some UAC configurations.
             # GetTokenInformation(TokenElevation) directly checks whether the
@@ -113,17 +186,17 @@ def is_admin():
             TokenElevation = 20
 
             class TOKEN_ELEVATION(ctypes.Structure):
-                _fields_ = [("TokenIsElevated", ctypes.wintypes.DWORD)]
+                _fields_ = [("TokenIsElevated", wintypes.DWORD)]
 
             hproc = ctypes.windll.kernel32.GetCurrentProcess()
-            htok  = ctypes.wintypes.HANDLE()
+            htok  = wintypes.HANDLE()
             if not ctypes.windll.advapi32.OpenProcessToken(
                 hproc, TOKEN_QUERY, ctypes.byref(htok)
             ):
                 return bool(ctypes.windll.shell32.IsUserAnAdmin())  # fallback
 
             elev = TOKEN_ELEVATION()
-            size = ctypes.wintypes.DWORD(ctypes.sizeof(elev))
+            size = wintypes.DWORD(ctypes.sizeof(elev))
             ok   = ctypes.windll.advapi32.GetTokenInformation(
                 htok, TokenElevation,
                 ctypes.byref(elev), ctypes.sizeof(elev), ctypes.byref(size),
@@ -137,6 +210,105 @@ def is_admin():
         return False
 
 
+# ── PowerShell session (Windows) ──────────────────────────────────────────────
+class _PSSession:
+    """
+    One `powershell -Command -` child shared by every PowerShell call.  Each
+    powershell.exe start costs ~250 ms of .NET start-up; the Set-Disk
+    offline/online pair around a write (plus a drive refresh, when wmic is
+    missing) would otherwise pay it several times.  It is started by the
+    first run() — never at all when wmic handles drive detection — and closed
+    when an install finishes, so it doesn't hold tens of MB for the session.
+    run() writes a one-line script to stdin followed by an echoed sentinel,
+    and reads stdout up to the sentinel.  Calls from different threads are
+    serialised.
+    """
+
+    _END = "__NOXIOM_PS_END__"
+
+    def __init__(self):
+        self._proc  = None
+        self._lines = None      # queue of stdout lines; None once PS exits
+        self._lock  = threading.Lock()
+
+    def run(self, script, timeout=15):
+        """
+        Run script (a single line) in its own scope.  Returns (ok, lines):
+        ok is False if the script threw, and lines is its output, error text
+        included.  Raises OSError if PowerShell is missing, dies or times out.
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._spawn()
+            try:
+                self._proc.stdin.write(
+                    f"$__ok = $true; try {{ & {{ {script} }} 2>&1 }} "
+                    f"catch {{ $__ok = $false; \"$_\" }}; \"{self._END} $__ok\"\n"
+                )
+                self._proc.stdin.flush()
+            except OSError:
+                self._kill()
+                raise
+            deadline = time.monotonic() + timeout
+            out = []
+            while True:
+                try:
+                    line = self._lines.get(
+                        timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    self._kill()
+                    raise OSError(f"PowerShell timed out after {timeout}s")
+                if line is None:
+                    self._kill()
+                    raise OSError("PowerShell exited unexpectedly")
+                if line.startswith(self._END):
+                    return line.endswith("True"), out
+                out.append(line)
+
+    def close(self):
+        # Don't wait on a run() in progress: the child's stdin closes when
+        # this process exits, which ends PowerShell anyway.
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._proc is not None:
+                try:
+                    self._proc.stdin.close()    # ends PowerShell's read loop
+                    self._proc.wait(timeout=2)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+                self._kill()
+        finally:
+            self._lock.release()
+
+    def _spawn(self):
+        self._proc = subprocess.Popen(
+            ["powershell", "-NoProfile", "-NonInteractive", "-Command", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, text=True,
+            encoding="utf-8", errors="replace",
+        )
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump,
+                         args=(self._proc.stdout, self._lines),
+                         daemon=True).start()
+
+    def _kill(self):
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                self._proc.kill()
+            self._proc = None
+
+    @staticmethod
+    def _pump(stdout, lines):
+        for line in stdout:
+            lines.put(line.rstrip("\r\n"))
+        lines.put(None)
+
+
+_ps = _PSSession()
+
+
 # ── Drive model ───────────────────────────────────────────────────────────────
 class Drive:
     def __init__(self, path, label, bus, size_bytes):
@@ -155,14 +327,11 @@ class Drive:
 
 # ── Drive detection (removable only) ─────────────────────────────────────────
 def list_drives():
-    system = platform.system()
+    backend = _DRIVE_BACKENDS.get(SYSTEM)
+    if backend is None:
+        return []
     try:
-        if system == "Windows":
-            return _drives_windows()
-        if system == "Linux":
-            return _drives_linux()
-        if system == "Darwin":
-            return _drives_macos()
+        return backend()
     except Exception as exc:
         log.warning(f"Drive detection error: {exc}")
     return []
@@ -175,8 +344,6 @@ def _disk_size_windows(disk_num):
     where the reader itself has no storage — the inserted media does).
     """
     try:
-        import ctypes
-        from ctypes import wintypes
         k32 = _setup_k32()
         GENERIC_READ             = 0x80000000
         FILE_SHARE_READ          = 0x1
@@ -209,83 +376,228 @@ def _disk_size_windows(disk_num):
         return 0
 
 
+def _partition_numbers(disk_num):
+    """
+    Partition numbers on PhysicalDriveN from a single
+    IOCTL_DISK_GET_DRIVE_LAYOUT_EX, or None if the layout can't be read.
+    """
+    try:
+        k32 = _setup_k32()
+        FILE_SHARE_READ          = 0x1
+        FILE_SHARE_WRITE         = 0x2
+        OPEN_EXISTING            = 3
+        INVALID_HANDLE           = ctypes.c_void_p(-1).value
+        IOCTL_DISK_GET_DRIVE_LAYOUT_EX = 0x00070050
+        LAYOUT_HEADER = 48      # DRIVE_LAYOUT_INFORMATION_EX up to PartitionEntry[]
+        ENTRY_SIZE    = 144     # sizeof(PARTITION_INFORMATION_EX)
+        MAX_ENTRIES   = 128     # GPT default maximum
+
+        # The IOCTL needs no access rights, so a zero-access handle works
+        # even while the drive's volumes are mounted.
+        h = k32.CreateFileW(
+            f"\\\\.\\PhysicalDrive{disk_num}",
+            0, FILE_SHARE_READ | FILE_SHARE_WRITE,
+            None, OPEN_EXISTING, 0, None,
+        )
+        if h == INVALID_HANDLE or h is None:
+            return None
+        buf = ctypes.create_string_buffer(LAYOUT_HEADER + ENTRY_SIZE * MAX_ENTRIES)
+        br  = wintypes.DWORD(0)
+        ok  = k32.DeviceIoControl(
+            h, IOCTL_DISK_GET_DRIVE_LAYOUT_EX,
+            None, 0, buf, ctypes.sizeof(buf),
+            ctypes.byref(br), None,
+        )
+        k32.CloseHandle(h)
+        if not ok:
+            return None
+        raw   = buf.raw
+        count = int.from_bytes(raw[4:8], "little")
+        nums  = []
+        # MBR layouts always report four-entry groups, unused slots included;
+        # those have a zero length and partition number.
+        for i in range(min(count, MAX_ENTRIES)):
+            off    = LAYOUT_HEADER + ENTRY_SIZE * i
+            length = int.from_bytes(raw[off + 16:off + 24], "little", signed=True)
+            number = int.from_bytes(raw[off + 24:off + 28], "little")
+            if length > 0 and number > 0:
+                nums.append(number)
+        return nums
+    except Exception as exc:
+        log.debug(f"Drive layout query for disk {disk_num} failed: {exc}")
+        return None
+
+
 def _drives_windows():
+    # wmic talks to WMI directly and starts in a fraction of the time it takes
+    # PowerShell to cold-start .NET.  It is deprecated (and absent on some
+    # Windows 11 builds), so PowerShell remains the fallback.
+    drives = _drives_windows_wmic()
+    if drives is None:
+        drives = _drives_windows_ps()
+    log.debug(f"Windows drives: {[str(d) for d in drives]}")
+    return drives
+
+
+def _drives_windows_wmic():
+    """Removable disks via `wmic diskdrive`; None if wmic is unavailable."""
+    import csv
+    try:
+        raw = subprocess.check_output(
+            ["wmic", "diskdrive", "get",
+             "Index,InterfaceType,MediaType,Model,Size", "/format:csv"],
+            stderr=subprocess.DEVNULL, timeout=15,
+        )
+    except Exception as exc:
+        log.debug(f"wmic drive query failed: {exc}")
+        return None
+    # wmic writes UTF-16 when redirected on some builds, ANSI on others.
+    if raw.startswith(b"\xff\xfe"):
+        text = raw.decode("utf-16", errors="replace")
+    else:
+        text = raw.decode("utf-8", errors="replace")
+    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+    drives = []
+    for d in csv.DictReader(lines):
+        iface = (d.get("InterfaceType") or "").upper()
+        media = d.get("MediaType") or ""
+        # SD slots usually report SCSI + "Removable Media"; USB sticks and
+        # card readers report USB.
+        if iface != "USB" and "Removable" not in media:
+            continue
+        try:
+            num = int(d.get("Index") or "")
+        except ValueError:
+            continue
+        name = (d.get("Model") or "").strip() or f"Disk {num}"
+        size = int(d.get("Size") or 0)
+        if size == 0:
+            size = _disk_size_windows(num)
+            log.debug(f"Disk {num} size from IOCTL: {size}")
+        bus  = "USB" if iface == "USB" else "SD"
+        drives.append(Drive(f"\\\\.\\PhysicalDrive{num}", name, bus, size))
+    return drives
+
+
+def _drives_windows_ps():
     ps = (
         "Get-Disk | Where-Object {$_.BusType -in @('USB','SD','MMC')} | "
-        "Select-Object Number,FriendlyName,Size,BusType | "
-        "ConvertTo-Json -Compress"
+        "ForEach-Object { "
+        "\"$($_.Number)`t$($_.Size)`t$($_.BusType)`t$($_.FriendlyName)\" }"
     )
     try:
-        raw = subprocess.check_output(
-            ["powershell", "-NoProfile", "-Command", ps],
-            stderr=subprocess.DEVNULL, timeout=15,
-        ).decode("utf-8", errors="replace").strip()
+        _, lines = _ps.run(ps)
     except Exception as exc:
         log.warning(f"PowerShell drive query failed: {exc}")
         return []
-    if not raw:
-        return []
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        return []
-    if isinstance(data, dict):
-        data = [data]
     drives = []
-    for d in data:
-        num  = d.get("Number", 0)
-        name = d.get("FriendlyName") or f"Disk {num}"
-        size = int(d.get("Size") or 0)
+    # One tab-separated line per disk: Number, Size, BusType, FriendlyName.
+    for line in lines:
+        fields = line.strip().split("\t", 3)
+        if len(fields) < 3:
+            continue
+        try:
+            num = int(fields[0])
+        except ValueError:
+            continue
+        name = (fields[3].strip() if len(fields) > 3 else "") or f"Disk {num}"
+        size = int(fields[1] or 0)
         # Get-Disk returns 0 for card readers that report the reader hardware,
         # not the inserted media.  Fall back to a direct IOCTL query.
         if size == 0:
             size = _disk_size_windows(num)
             log.debug(f"Disk {num} size from IOCTL: {size}")
-        bus  = (d.get("BusType") or "USB").upper()
+        bus  = (fields[2] or "USB").upper()
         drives.append(Drive(f"\\\\.\\PhysicalDrive{num}", name, bus, size))
-    log.debug(f"Windows drives: {[str(d) for d in drives]}")
     return drives
 
 
-def _parse_lsblk_size(s):
-    s = s.strip().upper()
-    mult = {"B": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
-    if s and s[-1] in mult:
-        try:
-            return int(float(s[:-1]) * mult[s[-1]])
-        except ValueError:
-            pass
-    try:
-        return int(s)
-    except ValueError:
-        return 0
+# Last /sys/block scan, reused for DRIVE_CACHE_TTL so a double-clicked
+# Refresh doesn't scan twice.
+_linux_scan = {"at": None, "drives": []}
 
 
 def _drives_linux():
+    now = time.monotonic()
+    if _linux_scan["at"] is not None and now - _linux_scan["at"] < DRIVE_CACHE_TTL:
+        return list(_linux_scan["drives"])
+    # sysfs answers in plain text what lsblk would need a fork, an exec and a
+    # JSON decode for.
     try:
-        raw  = subprocess.check_output(
-            ["lsblk", "-J", "-d", "-o", "NAME,SIZE,RM,TYPE,MODEL"],
-            stderr=subprocess.DEVNULL, timeout=10,
-        ).decode("utf-8", errors="replace")
-        data = json.loads(raw)
-    except Exception as exc:
-        log.warning(f"lsblk failed: {exc}")
+        names = sorted(os.listdir("/sys/block"))
+    except OSError as exc:
+        log.warning(f"/sys/block scan failed: {exc}")
         return []
     drives = []
-    for dev in data.get("blockdevices", []):
-        if str(dev.get("rm", "0")) != "1" or dev.get("type") != "disk":
+    for name in names:
+        if name.startswith(("loop", "dm-", "ram", "zram", "sr", "md")):
             continue
-        name  = dev.get("name", "")
-        model = (dev.get("model") or name).strip()
-        size  = _parse_lsblk_size(dev.get("size", "0"))
+        base = f"/sys/block/{name}"
+        if _read_sysfs(f"{base}/removable") != "1":
+            continue
+        try:
+            # sysfs counts 512-byte units whatever the logical sector size.
+            size = int(_read_sysfs(f"{base}/size") or 0) * 512
+        except ValueError:
+            size = 0
+        model = (_read_sysfs(f"{base}/device/model")
+                 or _read_sysfs(f"{base}/device/name") or name)    # name: MMC/SD
         drives.append(Drive(f"/dev/{name}", model, "USB", size))
     log.debug(f"Linux drives: {[str(d) for d in drives]}")
-    return drives
+    _linux_scan.update(at=now, drives=drives)
+    return list(drives)
+
+
+def _read_sysfs(path):
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _watch_linux_drives(on_change):
+    """
+    Call on_change() from a daemon thread whenever the kernel reports a whole
+    disk being added, removed or having its media changed (a card inserted in
+    a reader), using the netlink uevent socket udev itself listens on.  Also
+    drops the cached /sys/block scan so the next one sees the change.
+    Returns False if the socket can't be opened.
+    """
+    import socket
+    NETLINK_KOBJECT_UEVENT = 15
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM,
+                             NETLINK_KOBJECT_UEVENT)
+        sock.bind((0, 1))       # kernel-assigned port, kernel uevent group
+    except (AttributeError, OSError) as exc:
+        log.debug(f"uevent socket unavailable ({exc}); Refresh only")
+        return False
+
+    def run():
+        while True:
+            try:
+                # "ACTION@devpath\0KEY=value\0…"
+                fields = sock.recv(65536).split(b"\0")
+            except OSError:
+                return
+            if (fields[0].startswith((b"add@", b"remove@", b"change@"))
+                    and b"SUBSYSTEM=block" in fields
+                    and b"DEVTYPE=disk" in fields):
+                log.debug(f"uevent: {fields[0].decode(errors='replace')}")
+                _linux_scan["at"] = None
+                try:
+                    on_change()
+                except Exception:
+                    return      # window closed
+
+    threading.Thread(target=run, daemon=True).start()
+    return True
 
 
 def _drives_macos():
+    import plistlib
     try:
-        import plistlib
         raw = subprocess.check_output(
             ["diskutil", "list", "-plist", "external"],
             stderr=subprocess.DEVNULL, timeout=10,
@@ -294,26 +606,65 @@ def _drives_macos():
     except Exception as exc:
         log.warning(f"diskutil failed: {exc}")
         return []
+    items = pl.get("AllDisksAndPartitions", [])
+    # The list plist has no media names; fetch them for every disk in one
+    # `diskutil info` call instead of one spawn per device.
+    names = _macos_disk_names() if items else {}
     drives = []
-    for item in pl.get("AllDisksAndPartitions", []):
+    for item in items:
         dev_id = item.get("DeviceIdentifier", "")
         size   = int(item.get("Size", 0))
-        label  = _macos_disk_name(dev_id)
+        vols   = [part.get("VolumeName") for part in item.get("Partitions", [])]
+        label  = (item.get("MediaName") or names.get(dev_id)
+                  or next((v for v in vols if v), None) or dev_id)
         drives.append(Drive(f"/dev/{dev_id}", label, "EXTERNAL", size))
     return drives
 
 
-def _macos_disk_name(dev_id):
+def _macos_disk_names():
+    """{DeviceIdentifier: media name} from one `diskutil info -plist -all`."""
+    import plistlib
     try:
-        import plistlib
         raw = subprocess.check_output(
-            ["diskutil", "info", "-plist", dev_id],
-            stderr=subprocess.DEVNULL, timeout=5,
+            ["diskutil", "info", "-plist", "-all"],
+            stderr=subprocess.DEVNULL, timeout=10,
         )
-        pl = plistlib.loads(raw)
-        return pl.get("MediaName") or pl.get("IORegistryEntryName") or dev_id
-    except Exception:
-        return dev_id
+    except Exception as exc:
+        log.debug(f"diskutil info -all failed: {exc}")
+        return {}
+    # One plist document per disk and partition, back to back.
+    names = {}
+    for doc in raw.split(b"</plist>"):
+        start = doc.find(b"<?xml")
+        if start < 0:
+            continue
+        try:
+            pl = plistlib.loads(doc[start:] + b"</plist>")
+        except Exception:
+            continue
+        dev_id = pl.get("DeviceIdentifier")
+        name   = pl.get("MediaName") or pl.get("IORegistryEntryName")
+        if dev_id and name:
+            names[dev_id] = name
+    return names
+
+
+_DRIVE_BACKENDS = {
+    "Windows": _drives_windows,
+    "Linux":   _drives_linux,
+    "Darwin":  _drives_macos,
+}
+
+
+# ── HTTP ──────────────────────────────────────────────────────────────────────
+# One opener, and one TLS context, for every request.  urlopen()'s default
+# handler builds a new SSLContext per connection — reloading the system CA
+# store, ~20 ms — and an install opens one per range stream and retry on top
+# of the release query.
+_TLS_CONTEXT = ssl.create_default_context()
+_TLS_CONTEXT.set_alpn_protocols(["http/1.1"])
+_opener = urllib.request.build_opener(
+    urllib.request.HTTPSHandler(context=_TLS_CONTEXT))
 
 
 # ── GitHub release info ───────────────────────────────────────────────────────
@@ -330,16 +681,155 @@ class ReleaseInfo:
         return self.assets.get(name, {}).get("size", 0)
 
 
+# Only the fields fetch_release() reads — the REST listing also carries every
+# release body, uploader and asset metadata, several KB per release.
+_RELEASES_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    releases(first: 10, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        tagName
+        isDraft
+        isPrerelease
+        releaseAssets(first: 20) { nodes { name downloadUrl size } }
+      }
+    }
+  }
+}
+"""
+
+
+def _releases_graphql(token):
+    """Release list via GraphQL (needs a token), in the REST response's shape."""
+    body = json.dumps({
+        "query": _RELEASES_QUERY,
+        "variables": {"owner": GITHUB_OWNER, "name": GITHUB_REPO},
+    }).encode("utf-8")
+    req = urllib.request.Request(GRAPHQL_URL, data=body, headers={
+        "User-Agent":    "noxiom-installer/1.0",
+        "Authorization": f"bearer {token}",
+        "Content-Type":  "application/json",
+    })
+    with _opener.open(req, timeout=DOWNLOAD_TIMEOUT) as resp:
+        payload = json.loads(resp.read().decode("utf-8"))
+    if payload.get("errors"):
+        raise RuntimeError(payload["errors"][0].get("message", "GraphQL error"))
+    nodes = payload["data"]["repository"]["releases"]["nodes"]
+    # A token with push access also sees drafts; REST callers without one
+    # never do, and a draft is never what the installer should offer.
+    return [
+        {
+            "tag_name":   n["tagName"],
+            "prerelease": n["isPrerelease"],
+            "assets": [
+                {"name": a["name"], "browser_download_url": a["downloadUrl"],
+                 "size": a["size"]}
+                for a in n["releaseAssets"]["nodes"]
+            ],
+        }
+        for n in nodes
+        if not n["isDraft"]
+    ]
+
+
+def _releases_rest():
+    """
+    Anonymous REST release listing, revalidated against RELEASE_CACHE with
+    If-None-Match: an unchanged list comes back as a bodyless 304 that costs
+    no rate limit.  The cached copy also stands in when GitHub can't be
+    reached or refuses the request.
+    """
+    cache   = _load_release_cache()
+    headers = {"User-Agent": "noxiom-installer/1.0"}
+    if cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+    req = urllib.request.Request(API_URL, headers=headers)
+    try:
+        with _opener.open(req, timeout=DOWNLOAD_TIMEOUT) as resp:
+            body = resp.read().decode("utf-8")
+            etag = resp.headers.get("ETag")
+    except urllib.error.URLError as exc:
+        if "body" not in cache:
+            raise
+        if getattr(exc, "code", None) == 304:
+            log.info("Release list unchanged (HTTP 304); using cache")
+        else:
+            log.warning(f"Release query failed ({exc}); using cached list")
+        body = cache["body"]
+    else:
+        if etag:
+            _save_release_cache(etag, body)
+    releases = json.loads(body)
+    if not isinstance(releases, list):
+        releases = [releases]
+    return releases
+
+
+def _load_release_cache():
+    try:
+        if not _is_private(os.stat(CACHE_DIR)):
+            log.warning(f"Ignoring release cache: {CACHE_DIR} is not private")
+            return {}
+        fd = os.open(RELEASE_CACHE, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        with open(fd, encoding="utf-8") as f:
+            if not _is_private(os.fstat(f.fileno())):
+                log.warning(f"Ignoring release cache: {RELEASE_CACHE} "
+                            f"is not private")
+                return {}
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_release_cache(etag, body):
+    tmp = RELEASE_CACHE + ".tmp"
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        if not _is_private(os.stat(CACHE_DIR)):
+            log.warning(f"Not writing release cache: {CACHE_DIR} is not private")
+            return
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                     | getattr(os, "O_NOFOLLOW", 0), 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "body": body, "fetched_at": time.time()}, f)
+        os.replace(tmp, RELEASE_CACHE)
+    except OSError as exc:
+        log.debug(f"Could not write release cache: {exc}")
+
+
+def _is_private(st):
+    """True if the stat result st is owned by us and writable by no one else."""
+    if SYSTEM == "Windows":
+        return True     # %LOCALAPPDATA% is already ACL'd to the user
+    return st.st_uid == os.geteuid() and not st.st_mode & 0o022
+
+
+def _is_github_url(url):
+    parts = urllib.parse.urlsplit(url)
+    host  = (parts.hostname or "").lower()
+    return parts.scheme == "https" and any(
+        host == h or host.endswith("." + h) for h in ASSET_HOSTS)
+
+
 def fetch_release():
     """
     Return the most recent pre-release.  Falls back to the most recent
     release of any kind if no pre-release exists.
+
+    With GITHUB_TOKEN set, asks GraphQL for just the fields used here;
+    otherwise (or if that fails) uses the anonymous REST listing.
     """
-    req = urllib.request.Request(API_URL, headers={"User-Agent": "noxiom-installer/1.0"})
-    with urllib.request.urlopen(req, timeout=DOWNLOAD_TIMEOUT) as resp:
-        releases = json.loads(resp.read().decode("utf-8"))
-    if not isinstance(releases, list):
-        releases = [releases]
+    releases = None
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        try:
+            releases = _releases_graphql(token)
+        except Exception as exc:
+            log.warning(f"GraphQL release query failed ({exc}); using REST")
+    if releases is None:
+        releases = _releases_rest()
+    releases = [r for r in releases if not r.get("draft")]
 
     data = next((r for r in releases if r.get("prerelease")), None)
     if data is None:
@@ -349,26 +839,33 @@ def fetch_release():
         raise RuntimeError("No releases found on GitHub. Check the releases page.")
 
     tag    = data.get("tag_name", "unknown")
-    assets = {
-        a["name"]: {"url": a["browser_download_url"], "size": int(a.get("size", 0))}
-        for a in data.get("assets", [])
-    }
+    assets = {}
+    for a in data.get("assets", []):
+        url = a["browser_download_url"]
+        if not _is_github_url(url):
+            log.warning(f"Ignoring asset {a['name']!r}: not a GitHub URL: {url}")
+            continue
+        assets[a["name"]] = {"url": url, "size": int(a.get("size", 0))}
     log.info(f"Release: {tag}  prerelease={data.get('prerelease')}  assets={list(assets)}")
     return ReleaseInfo(tag, assets, bool(data.get("prerelease")))
 
 
 # ── Speed / ETA tracker ───────────────────────────────────────────────────────
+_INV_MIB = 1.0 / (1024 * 1024)     # bytes → MB by multiplication
+
+
 class SpeedTracker:
     """Rolling-window bytes-per-second tracker."""
 
     def __init__(self):
-        self._hist = []   # [(monotonic_time, total_bytes)]
+        self._hist = collections.deque()   # (monotonic_time, total_bytes)
 
     def update(self, total_bytes):
         now = time.monotonic()
         self._hist.append((now, total_bytes))
         cutoff = now - SPEED_WINDOW
-        self._hist = [(t, b) for t, b in self._hist if t >= cutoff]
+        while self._hist[0][0] < cutoff:
+            self._hist.popleft()
 
     def bps(self):
         if len(self._hist) < 2:
@@ -389,56 +886,350 @@ class SpeedTracker:
         if bps <= 0:
             return ""
         if bps >= 1024 ** 2:
-            return f"  {bps / 1024**2:.1f} MB/s"
+            return f"  {bps * _INV_MIB:.1f} MB/s"
         return f"  {bps / 1024:.0f} KB/s"
 
 
-# ── Download with retry ───────────────────────────────────────────────────────
-def download_asset(url, dest_path, progress_cb, cancel_event):
+# ── Resumable download stream ─────────────────────────────────────────────────
+# Network failures worth retrying.  Device errors (access denied, write-
+# protected, …) are plain OSErrors and fail immediately.
+_NET_ERRORS = (urllib.error.URLError, http.client.HTTPException,
+               ConnectionError, TimeoutError)
+
+
+class _HTTPStream:
     """
-    Stream url → dest_path, retrying up to DOWNLOAD_RETRIES times.
-    Raises InterruptedError if cancel_event fires.
+    Read-only binary stream over an HTTP download that survives dropped
+    connections.  A failed request or read reopens the URL with a Range header
+    and carries on from the last byte received, retrying up to
+    DOWNLOAD_RETRIES times in a row with exponential back-off.  Only
+    readinto() is provided — it is all the device writers use.
+
+    start/stop bound the stream to one byte range of the file.  An open-ended
+    stream connects immediately so length and ranges are known up front; a
+    bounded one connects on its first read.
+
+    The first response pins the stream: later requests go to the URL it was
+    redirected to, and carry If-Range with its ETag (or Last-Modified).  The
+    release URL is stable but its asset is replaced on every nightly build,
+    so without this a resume or a parallel range could splice bytes of two
+    builds into one image of the same size.  A range that comes back whole
+    or with another validator aborts the download instead.
     """
-    last_exc = None
-    for attempt in range(1, DOWNLOAD_RETRIES + 1):
-        if cancel_event.is_set():
+
+    def __init__(self, url, cancel_event, start=0, stop=0):
+        self.url       = url
+        self.origin    = url     # URL as given; self.url may be a redirect
+        self.validator = None    # If-Range value pinned by the first response
+        self.pos       = start   # next byte of the file to deliver
+        self.stop      = stop    # end of the range, 0 if unknown
+        self.length    = 0       # full Content-Length, 0 if unknown
+        self.ranges    = False   # server advertised Accept-Ranges: bytes
+        self._cancel   = cancel_event
+        self._resp    = None
+        self._failures = 0
+        if not stop:
+            self._connect()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._resp is not None:
+            self._resp.close()
+            self._resp = None
+
+    def subrange(self, start, stop):
+        """A bounded stream over bytes start…stop of the same file version."""
+        sub = _HTTPStream(self.url, self._cancel, start, stop)
+        sub.origin    = self.origin
+        sub.validator = self.validator
+        return sub
+
+    def readinto(self, b):
+        if self.stop:
+            if self.pos >= self.stop:
+                return 0
+            b = memoryview(b)[:self.stop - self.pos]
+        while True:
+            self._connect()
+            try:
+                n = self._resp.readinto(b)
+                # urllib reports a connection closed early as a clean EOF.
+                if not n and self.pos < self.stop:
+                    raise http.client.IncompleteRead(b"", self.stop - self.pos)
+            except _NET_ERRORS as exc:
+                self._fail(exc)
+                continue
+            self.pos += n
+            self._failures = 0
+            return n
+
+    def _connect(self):
+        while self._resp is None:
+            if self._cancel.is_set():
+                raise InterruptedError("Cancelled.")
+            log.info(f"Download request: {self.url}  from byte {self.pos}")
+            # identity: the image is already compressed — never let a mirror
+            # gzip it again and make us pay to inflate it.
+            headers = {"User-Agent": "noxiom-installer/1.0",
+                       "Accept-Encoding": "identity"}
+            if self.pos or self.stop:
+                end = self.stop - 1 if self.stop else ""
+                headers["Range"] = f"bytes={self.pos}-{end}"
+                if self.validator:
+                    headers["If-Range"] = self.validator
+            req = urllib.request.Request(self.url, headers=headers)
+            try:
+                resp = _opener.open(req, timeout=DOWNLOAD_TIMEOUT)
+                if not self.pos and not self.stop:
+                    self.url       = resp.geturl()
+                    self.validator = _validator(resp.headers)
+                    self.length = int(resp.headers.get("Content-Length") or 0)
+                    self.stop   = self.length
+                    self.ranges = (resp.headers.get("Accept-Ranges", "")
+                                   .lower() == "bytes")
+                    log.debug(f"Download pinned to {self.url}  "
+                              f"validator={self.validator}")
+                elif self.validator and (resp.status != 206
+                                         or not self._same_version(resp)):
+                    # If-Range failed: the server sent another version whole.
+                    resp.close()
+                    raise OSError("The image was replaced on the server during "
+                                  "the download (a new build was published). "
+                                  "Please retry.")
+                elif resp.status != 206:
+                    # Server ignored Range; skip the bytes we already have.
+                    log.warning(f"No range support (HTTP {resp.status}); "
+                                f"skipping {self.pos} bytes")
+                    skip    = self.pos
+                    scratch = memoryview(bytearray(min(skip, DOWNLOAD_CHUNK)))
+                    while skip:
+                        n = resp.readinto(scratch[:skip])
+                        if not n:
+                            raise http.client.IncompleteRead(b"", skip)
+                        skip -= n
+            except _NET_ERRORS as exc:
+                if (isinstance(exc, urllib.error.HTTPError)
+                        and self.url != self.origin):
+                    # Signed CDN redirects expire; If-Range still guards
+                    # against a changed file on the way back through origin.
+                    log.info(f"Pinned URL refused ({exc}); back to {self.origin}")
+                    self.url = self.origin
+                self._fail(exc)
+                continue
+            self._resp = resp
+
+    def _same_version(self, resp):
+        # Compare like with like: an ETag validator with the ETag header,
+        # a Last-Modified one with Last-Modified.  A missing header passes.
+        name = "ETag" if self.validator.startswith('"') else "Last-Modified"
+        got  = resp.headers.get(name)
+        return got is None or got == self.validator
+
+    def _fail(self, exc):
+        self.close()
+        self._failures += 1
+        log.warning(f"Download attempt {self._failures} failed "
+                    f"at byte {self.pos}: {exc}")
+        if self._failures >= DOWNLOAD_RETRIES:
+            raise OSError(f"Download failed after {DOWNLOAD_RETRIES} attempts: {exc}")
+        wait = 2 ** self._failures
+        log.info(f"Retrying in {wait}s…")
+        if self._cancel.wait(wait):
             raise InterruptedError("Cancelled.")
+
+
+def _validator(headers):
+    """
+    If-Range validator from response headers: a strong ETag, else
+    Last-Modified, else None.  (If-Range does not accept weak ETags.)
+    """
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+# ── Stream image straight to the drive ────────────────────────────────────────
+def stream_to_device(url, device_path, total_bytes, progress_cb, cancel_event):
+    """
+    Stream url → device_path with no intermediate file.  A dropped connection
+    resumes from the last byte received (see _HTTPStream), so the drive is
+    written in a single pass.  Servers that accept Range requests are read
+    over several connections at once (see _split_ranges).
+    progress_cb receives the number of bytes written to the drive so far.
+    Returns the byte count written.  Raises InterruptedError if cancel_event
+    fires, OSError if the byte count disagrees with the expected size.
+    """
+    log.info(f"Streaming {url} → {device_path} ({total_bytes} bytes expected)")
+    with _HTTPStream(url, cancel_event) as src:
+        length  = total_bytes or src.length
+        chunk   = _chunk_size(length)
+        sources = _split_ranges(src, length, chunk)
         try:
-            log.info(f"Download attempt {attempt}: {url}")
-            req = urllib.request.Request(url, headers={"User-Agent": "noxiom-installer/1.0"})
-            downloaded = 0
-            with urllib.request.urlopen(req, timeout=DOWNLOAD_TIMEOUT) as resp, \
-                 open(dest_path, "wb") as f:
-                while True:
-                    if cancel_event.is_set():
-                        raise InterruptedError("Cancelled.")
-                    chunk = resp.read(64 * 1024)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    progress_cb(downloaded)
-            log.info(f"Download complete: {downloaded} bytes")
-            return
-        except InterruptedError:
-            raise
-        except Exception as exc:
-            last_exc = exc
-            log.warning(f"Download attempt {attempt} failed: {exc}")
-            if attempt < DOWNLOAD_RETRIES:
-                wait = 2 ** attempt
-                log.info(f"Retrying in {wait}s…")
-                time.sleep(wait)
-    raise OSError(f"Download failed after {DOWNLOAD_RETRIES} attempts: {last_exc}")
+            written = write_image(sources, device_path, progress_cb,
+                                  cancel_event, chunk_size=chunk)
+        finally:
+            for _, s in sources:
+                s.close()
+    # The writers count every byte, so the size check needs no stat or
+    # re-read of the image.
+    if length and written != length:
+        raise OSError(f"Image size mismatch: wrote {written} bytes, "
+                      f"expected {length}. The download may be corrupt; retry.")
+    return written
+
+
+def _split_ranges(src, length, chunk_size):
+    """
+    Split a download into up to DOWNLOAD_STREAMS byte ranges, each read
+    over its own connection: a single TCP flow rarely fills a fast link.
+    src, already open at byte 0, keeps the first range.  Ranges start on whole
+    chunks, so only the last one can end in a short chunk.  Returns the
+    (offset, stream) pairs write_image takes; just [(0, src)] when the server
+    does not advertise Range support or the image is only a few chunks long.
+    """
+    chunks = -(-length // chunk_size)
+    parts  = min(DOWNLOAD_STREAMS, chunks // 4)
+    if parts < 2 or not src.ranges or src.length != length:
+        return [(0, src)]
+    span     = -(-chunks // parts) * chunk_size
+    src.stop = span
+    sources  = [(0, src)]
+    for start in range(span, length, span):
+        stop = min(start + span, length)
+        sources.append((start, src.subrange(start, stop)))
+    log.info(f"Downloading over {len(sources)} connections "
+             f"({span} bytes each)")
+    return sources
+
+
+def _chunk_size(total_bytes):
+    """
+    Device write size: always WRITE_CHUNK, the size USB transfers are fastest
+    at, except that an image shorter than that gets buffers of its own length
+    rounded up to a whole sector rather than PIPELINE_DEPTH mostly-empty ones.
+    """
+    if 0 < total_bytes < WRITE_CHUNK:
+        return -(-total_bytes // SECTOR) * SECTOR
+    return WRITE_CHUNK
 
 
 # ── Write image to device ─────────────────────────────────────────────────────
-def write_image(image_path, device_path, progress_cb, cancel_event):
-    log.info(f"Writing {image_path} → {device_path}")
-    if platform.system() == "Windows":
-        _write_windows(image_path, device_path, progress_cb, cancel_event)
-    else:
-        _write_unix(image_path, device_path, progress_cb, cancel_event)
+def write_image(src, device_path, progress_cb, cancel_event,
+                chunk_size=WRITE_CHUNK):
+    """
+    Write the binary stream src (HTTP response or open file) → device_path.
+    src may instead be a list of (offset, stream) pairs, read concurrently and
+    each written from its offset on.
+    Returns the number of image bytes written (excluding sector padding).
+    """
+    if not isinstance(src, list):
+        src = [(0, src)]
+    log.info(f"Writing stream → {device_path}  (chunk {chunk_size} bytes)")
+    writer = _WRITERS.get(SYSTEM, _write_unix)
+    return writer(src, device_path, progress_cb, cancel_event, chunk_size)
+
+
+class _Prefetcher:
+    """
+    Fill caller-owned buffers from background reader threads.
+
+    sources is a list of (offset, stream) pairs; each stream is read in order
+    on its own thread, and its bytes belong in the image from offset on.
+    views are equal-sized writable buffers owned by the caller, so each
+    platform writer controls their alignment.  Iterating yields
+    (view, n, offset) triples as buffers fill — in stream order for a single
+    source — and the caller hands each buffer back with release() once it has
+    been written, and a reader refills it.  While the caller writes, the
+    readers fill the other buffers, overlapping network and disk I/O instead
+    of alternating between them.  Reader errors — including InterruptedError
+    on cancel — are re-raised in the caller.
+    """
+
+    def __init__(self, sources, views, cancel_event):
+        self._cancel  = cancel_event
+        self._free    = queue.Queue()
+        self._full    = queue.Queue()
+        self._stop    = False
+        for v in views:
+            self._free.put(v)
+        self._threads = [threading.Thread(target=self._reader, args=source,
+                                          daemon=True)
+                         for source in sources]
+        for t in self._threads:
+            t.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __iter__(self):
+        running = len(self._threads)
+        while running:
+            item = self._full.get()
+            if item is None:
+                running -= 1        # one source reached EOF
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield item
+
+    def release(self, view):
+        self._free.put(view)
+
+    def close(self):
+        # Stop the readers and wait out any in-progress fill, so the caller
+        # can safely free the buffers afterwards.
+        self._stop = True
+        for _ in self._threads:
+            self._free.put(None)
+        for t in self._threads:
+            t.join()
+
+    def _reader(self, offset, src):
+        try:
+            while True:
+                view = self._free.get()
+                if view is None or self._stop:
+                    return
+                if self._cancel.is_set():
+                    raise InterruptedError("Cancelled.")
+                n = _read_into(src, view)
+                if n:
+                    self._full.put((view, n, offset))
+                    offset += n
+                if n < len(view):
+                    if not n:
+                        self._free.put(view)
+                    self._full.put(None)
+                    return
+        except BaseException as exc:
+            self._full.put(exc)
+
+
+def _read_into(src, view):
+    """
+    Fill the writable buffer view from src, stopping short only at EOF, and
+    return the byte count.  HTTP responses can return short reads; collecting
+    whole chunks means only the final write is ever smaller than the buffer
+    (and, on Windows, the only one that needs sector padding).  Reads are at
+    most DOWNLOAD_CHUNK bytes each, whatever the (device-sized) buffer.
+    """
+    size = len(view)
+    got  = 0
+    while got < size:
+        n = src.readinto(view[got:got + DOWNLOAD_CHUNK])
+        if not n:
+            break
+        got += n
+    return got
 
 
 def _setup_k32():
@@ -449,8 +1240,6 @@ def _setup_k32():
     On 64-bit Windows a HANDLE is 64 bits, so large handle values get truncated
     and every subsequent API call silently operates on a garbage handle.
     """
-    import ctypes
-    from ctypes import wintypes
     k = ctypes.WinDLL("kernel32", use_last_error=True)
 
     # HANDLE is void* — use c_void_p so 64-bit values survive the round-trip.
@@ -492,6 +1281,32 @@ def _setup_k32():
         H,               # lpOverlapped
     ]
 
+    k.GetOverlappedResult.restype  = ctypes.c_bool
+    k.GetOverlappedResult.argtypes = [
+        H,               # hFile
+        H,               # lpOverlapped
+        H,               # lpNumberOfBytesTransferred
+        ctypes.c_bool,   # bWait
+    ]
+
+    k.CancelIoEx.restype  = ctypes.c_bool
+    k.CancelIoEx.argtypes = [H, H]
+
+    k.CreateEventW.restype  = H
+    k.CreateEventW.argtypes = [
+        H,                  # lpEventAttributes (NULL)
+        ctypes.c_bool,      # bManualReset
+        ctypes.c_bool,      # bInitialState
+        ctypes.c_wchar_p,   # lpName (NULL)
+    ]
+
+    # VirtualAlloc memory is page-aligned, as FILE_FLAG_NO_BUFFERING needs.
+    k.VirtualAlloc.restype  = H
+    k.VirtualAlloc.argtypes = [H, ctypes.c_size_t, wintypes.DWORD, wintypes.DWORD]
+
+    k.VirtualFree.restype  = ctypes.c_bool
+    k.VirtualFree.argtypes = [H, ctypes.c_size_t, wintypes.DWORD]
+
     k.FindFirstVolumeW.restype  = H
     k.FindFirstVolumeW.argtypes = [ctypes.c_wchar_p, wintypes.DWORD]
 
@@ -514,15 +1329,14 @@ def _ps_disk_offline(disk_num):
     if disk_num < 0:
         return False
     try:
-        result = subprocess.run(
-            ["powershell", "-NoProfile", "-NonInteractive", "-Command",
-             f"$ErrorActionPreference='Stop'; Set-Disk -Number {disk_num} -IsOffline $true"],
-            capture_output=True, timeout=15,
+        # One round trip: skip Set-Disk when the disk is already offline.
+        ok, out = _ps.run(
+            f"$ErrorActionPreference='Stop'; "
+            f"if (-not (Get-Disk -Number {disk_num}).IsOffline) "
+            f"{{ Set-Disk -Number {disk_num} -IsOffline $true }}"
         )
-        ok = result.returncode == 0
-        stderr = result.stderr.decode(errors='replace').strip()
         log.debug(f"PowerShell Set-Disk offline: disk={disk_num} ok={ok} "
-                  f"rc={result.returncode} stderr={stderr!r}")
+                  f"output={' '.join(out)!r}")
         return ok
     except Exception as exc:
         log.debug(f"PowerShell Set-Disk offline failed: {exc}")
@@ -534,24 +1348,67 @@ def _ps_disk_online(disk_num):
     if disk_num < 0:
         return
     try:
-        subprocess.run(
-            ["powershell", "-NoProfile", "-NonInteractive", "-Command",
-             f"Set-Disk -Number {disk_num} -IsOffline $false; "
-             f"Set-Disk -Number {disk_num} -IsReadOnly $false"],
-            capture_output=True, timeout=15,
-        )
+        _ps.run(f"Set-Disk -Number {disk_num} -IsOffline $false; "
+                f"Set-Disk -Number {disk_num} -IsReadOnly $false")
         log.debug(f"PowerShell Set-Disk online: disk={disk_num}")
     except Exception as exc:
         log.debug(f"PowerShell Set-Disk online failed (non-fatal): {exc}")
 
 
-def _write_windows(image_path, device_path, progress_cb, cancel_event):
-    import ctypes
-    from ctypes import wintypes
+def _dismount_partitions(disk_num, parts):
+    """
+    Lock and dismount every partition on disk_num via its HarddiskNPartitionM
+    device path, which works for ALL filesystem types including Linux ext4/btrfs (unlike
+    FindFirstVolumeW which only finds FAT/NTFS).  parts is the list from
+    _partition_numbers(); None probes Partition1..31 instead.
+
+    CRITICAL: partition handles are CLOSED IMMEDIATELY after dismounting.
+    Keeping them open while writing to the physical drive causes the Windows
+    storage stack to return error 483 (conflicting device object access).
+    """
+    k32 = _setup_k32()
+    GENERIC_READ          = 0x80000000
+    GENERIC_WRITE         = 0x40000000
+    FILE_SHARE_READ       = 0x00000001
+    FILE_SHARE_WRITE      = 0x00000002
+    OPEN_EXISTING         = 3
+    INVALID_HANDLE        = ctypes.c_void_p(-1).value
+    FSCTL_LOCK_VOLUME     = 0x00090018
+    FSCTL_DISMOUNT_VOLUME = 0x00090020
 
+    def _ioctl(h, code):
+        br = wintypes.DWORD(0)
+        return k32.DeviceIoControl(h, code, None, 0, None, 0,
+                                   ctypes.byref(br), None)
+
+    for part_num in (parts if parts is not None else range(1, 32)):
+        part_path = f"\\\\.\\Harddisk{disk_num}Partition{part_num}"
+        h = None
+        for access in [GENERIC_READ | GENERIC_WRITE, GENERIC_READ, 0]:
+            tmp = k32.CreateFileW(
+                part_path, access,
+                FILE_SHARE_READ | FILE_SHARE_WRITE,
+                None, OPEN_EXISTING, 0, None,
+            )
+            if tmp not in (INVALID_HANDLE, None):
+                h = tmp
+                break
+        if h is None:
+            err = ctypes.get_last_error()
+            log.debug(f"  {part_path}: open failed err={err}")
+            if parts is None and err in (2, 3, 87, 1168):
+                break   # No more partitions on this disk
+            continue    # Unexpected error; skip this slot
+        ok_l = _ioctl(h, FSCTL_LOCK_VOLUME)
+        ok_d = _ioctl(h, FSCTL_DISMOUNT_VOLUME)
+        log.debug(f"  {part_path}: lock={ok_l} dismount={ok_d}")
+        k32.CloseHandle(h)   # ← close immediately; lock auto-releases on close
+
+
+def _write_windows(src, device_path, progress_cb, cancel_event,
+                   chunk_size=WRITE_CHUNK):
     k32 = _setup_k32()
 
-    GENERIC_READ             = 0x80000000
     GENERIC_WRITE            = 0x40000000
     FILE_SHARE_READ          = 0x00000001
     FILE_SHARE_WRITE         = 0x00000002
@@ -561,18 +1418,15 @@ def _write_windows(image_path, device_path, progress_cb, cancel_event):
     # write directly to the storage hardware — required for reliable raw disk writes.
     FILE_FLAG_NO_BUFFERING   = 0x20000000
     FILE_FLAG_WRITE_THROUGH  = 0x80000000
+    FILE_FLAG_OVERLAPPED     = 0x40000000
+    ERROR_IO_PENDING         = 997
+    STATUS_PENDING           = 0x00000103
+    MEM_COMMIT               = 0x00001000
+    MEM_RESERVE              = 0x00002000
+    MEM_RELEASE              = 0x00008000
+    PAGE_READWRITE           = 0x04
 
-    FSCTL_LOCK_VOLUME    = 0x00090018
-    FSCTL_DISMOUNT_VOLUME = 0x00090020
-
-    def _ioctl(h, code, out_buf=None, out_size=0):
-        br = wintypes.DWORD(0)
-        return k32.DeviceIoControl(
-            h, code,
-            None, 0,
-            out_buf, out_size,
-            ctypes.byref(br), None,
-        )
+    FSCTL_LOCK_VOLUME        = 0x00090018
 
     # Disk number from "\\.\PhysicalDriveN"
     try:
@@ -586,45 +1440,20 @@ def _write_windows(image_path, device_path, progress_cb, cancel_event):
     # Fails for USB removable media ("Removable media cannot be set to offline").
     ps_offline = _ps_disk_offline(disk_num)
 
-    # ── Secondary: per-partition lock + dismount ──────────────────────────────
-    # Uses \\.\HarddiskNPartitionM — works for ALL filesystem types including
-    # Linux ext4/btrfs (unlike FindFirstVolumeW which only finds FAT/NTFS).
-    #
-    # CRITICAL: partition handles are CLOSED IMMEDIATELY after dismounting.
-    # Keeping them open while writing to the physical drive causes the Windows
-    # storage stack to return error 483 (conflicting device object access).
-    if not ps_offline:
-        log.debug("Set-Disk offline unavailable; locking partitions by device path")
-        if disk_num >= 0:
-            for part_num in range(1, 32):
-                part_path = f"\\\\.\\Harddisk{disk_num}Partition{part_num}"
-                h = None
-                for access in [GENERIC_READ | GENERIC_WRITE, GENERIC_READ, 0]:
-                    tmp = k32.CreateFileW(
-                        part_path, access,
-                        FILE_SHARE_READ | FILE_SHARE_WRITE,
-                        None, OPEN_EXISTING, 0, None,
-                    )
-                    if tmp not in (INVALID_HANDLE, None):
-                        h = tmp
-                        break
-                if h is None:
-                    err = ctypes.get_last_error()
-                    log.debug(f"  {part_path}: open failed err={err}")
-                    if err in (2, 3, 87, 1168):
-                        break   # No more partitions on this disk
-                    continue    # Unexpected error; skip this slot
-                ok_l = _ioctl(h, FSCTL_LOCK_VOLUME)
-                ok_d = _ioctl(h, FSCTL_DISMOUNT_VOLUME)
-                log.debug(f"  {part_path}: lock={ok_l} dismount={ok_d}")
-                k32.CloseHandle(h)   # ← close immediately; lock auto-releases on close
-
-    # Open physical drive for direct raw write.
+    # Read the partition table before the drive is locked: the layout query
+    # opens a handle of its own, which the drive lock would shut out.
+    parts = None
+    if not ps_offline and disk_num >= 0:
+        parts = _partition_numbers(disk_num)
+        log.debug(f"Partitions from drive layout: {parts}")
+
+    # Open physical drive for direct raw write.  FILE_FLAG_OVERLAPPED lets
+    # several WriteFile calls be queued on the device at once.
     handle = k32.CreateFileW(
         device_path, GENERIC_WRITE,
         FILE_SHARE_READ | FILE_SHARE_WRITE,
         None, OPEN_EXISTING,
-        FILE_FLAG_NO_BUFFERING | FILE_FLAG_WRITE_THROUGH,
+        FILE_FLAG_NO_BUFFERING | FILE_FLAG_WRITE_THROUGH | FILE_FLAG_OVERLAPPED,
         None,
     )
     if handle == INVALID_HANDLE or handle is None:
@@ -634,68 +1463,313 @@ def _write_windows(image_path, device_path, progress_cb, cancel_event):
         log.error(f"CreateFileW({device_path}) failed: error {err}")
         raise OSError(_win_err(err))
 
+    class OVERLAPPED(ctypes.Structure):
+        _fields_ = [
+            ("Internal",     ctypes.c_size_t),
+            ("InternalHigh", ctypes.c_size_t),
+            ("Offset",       wintypes.DWORD),
+            ("OffsetHigh",   wintypes.DWORD),
+            ("hEvent",       ctypes.c_void_p),
+        ]
+
+    def _lock_drive(h):
+        # h is an overlapped handle, so DeviceIoControl needs an OVERLAPPED.
+        ovl = OVERLAPPED()
+        ovl.hEvent = k32.CreateEventW(None, True, False, None)
+        if not ovl.hEvent:
+            return False
+        try:
+            br = wintypes.DWORD(0)
+            ok = k32.DeviceIoControl(h, FSCTL_LOCK_VOLUME, None, 0, None, 0,
+                                     ctypes.byref(br), ctypes.byref(ovl))
+            if not ok and ctypes.get_last_error() == ERROR_IO_PENDING:
+                ok = k32.GetOverlappedResult(h, ctypes.byref(ovl),
+                                             ctypes.byref(br), True)
+            return bool(ok)
+        finally:
+            k32.CloseHandle(ovl.hEvent)
+
     written_total = 0
+    bufs   = []     # VirtualAlloc'd buffer addresses
+    events = []
     try:
+        # ── Secondary: lock the drive handle and dismount each partition ─────
+        # Many Windows builds accept FSCTL_LOCK_VOLUME on the physical drive
+        # handle, but that does not dismount the volumes on it, and raw writes
+        # into a mounted volume's sectors are refused (error 5) unless that
+        # volume itself is locked or dismounted.  So every partition is still
+        # locked and dismounted; the drive lock is an extra step, as in Rufus.
+        if not ps_offline:
+            drive_locked = _lock_drive(handle)
+            log.debug(f"Set-Disk offline unavailable; drive lock="
+                      f"{drive_locked}; locking partitions by device path")
+            if disk_num >= 0:
+                _dismount_partitions(disk_num, parts)
+
         # FILE_FLAG_NO_BUFFERING requires the buffer to be aligned to the disk's
-        # sector size.  Over-allocate by 4095 bytes so we can find a 4096-byte-
-        # aligned start address inside the allocation (works for both 512-byte
-        # and 4096-byte / "Advanced Format" native-sector drives).
-        _io_raw = (ctypes.c_char * (CHUNK + 4095))()
-        _io_off = (4096 - ctypes.addressof(_io_raw) % 4096) % 4096
-        io_buf  = (ctypes.c_char * CHUNK).from_address(
-            ctypes.addressof(_io_raw) + _io_off
-        )
-        with open(image_path, "rb") as f:
-            while True:
-                if cancel_event.is_set():
-                    raise InterruptedError("Cancelled.")
-                chunk = f.read(CHUNK)
-                if not chunk:
-                    break
-                # Write size must be a multiple of the sector size.
-                # 4096 covers both 512-byte and 4K-native drives.
-                if len(chunk) % 4096 != 0:
-                    chunk = chunk + b"\x00" * (4096 - len(chunk) % 4096)
-                ctypes.memmove(io_buf, chunk, len(chunk))
-                written = wintypes.DWORD(0)
-                ok = k32.WriteFile(handle, io_buf, len(chunk),
-                                    ctypes.byref(written), None)
+        # sector size.  VirtualAlloc hands out page-aligned memory, which covers
+        # both 512-byte and 4096-byte / "Advanced Format" native-sector drives.
+        for _ in range(PIPELINE_DEPTH):
+            addr = k32.VirtualAlloc(None, chunk_size,
+                                    MEM_COMMIT | MEM_RESERVE, PAGE_READWRITE)
+            if not addr:
+                raise OSError(_win_err(ctypes.get_last_error()))
+            bufs.append(addr)
+        # The reader thread fills the aligned buffers directly — no
+        # intermediate bytes object and no memmove per chunk.
+        views   = [memoryview((ctypes.c_char * chunk_size).from_address(a))
+                   .cast("B") for a in bufs]
+        io_addr = {id(v): a for v, a in zip(views, bufs)}    # id(view) → address
+
+        free_ovl = collections.deque()
+        for _ in range(WRITE_QUEUE_DEPTH):
+            ev = k32.CreateEventW(None, True, False, None)
+            if not ev:
+                raise OSError(_win_err(ctypes.get_last_error()))
+            events.append(ev)
+            ovl = OVERLAPPED()
+            ovl.hEvent = ev
+            free_ovl.append(ovl)
+
+        # Up to WRITE_QUEUE_DEPTH overlapped writes are in flight at once, so
+        # the device queue never drains while Python waits on the previous
+        # write.  They are retired in the order they were issued.
+        with _Prefetcher(src, views, cancel_event) as chunks:
+            inflight = collections.deque()    # (OVERLAPPED, view, n, size)
+
+            def retire():
+                nonlocal written_total
+                ovl, io_view, n, size = inflight.popleft()
+                done = wintypes.DWORD(0)
+                ok = k32.GetOverlappedResult(handle, ctypes.byref(ovl),
+                                             ctypes.byref(done), True)
+                free_ovl.append(ovl)
                 if not ok:
                     err = ctypes.get_last_error()
                     log.error(f"WriteFile failed: error {err}")
                     raise OSError(_win_err(err))
-                written_total += written.value
+                if done.value != size:
+                    raise OSError(f"Short write: {done.value} of {size} bytes")
+                chunks.release(io_view)
+                written_total += n
                 progress_cb(written_total)
+
+            try:
+                for io_view, n, offset in chunks:
+                    if cancel_event.is_set():
+                        raise InterruptedError("Cancelled.")
+                    # Write size must be a multiple of the sector size.
+                    # SECTOR covers both 512-byte and 4K-native drives.  Only
+                    # the final chunk can be short; zero its tail in place
+                    # (a zero-length memset for every other chunk).  Buffers
+                    # are reused, so the tail can't be zeroed up front.
+                    addr = io_addr[id(io_view)]
+                    size = (n + SECTOR - 1) & -SECTOR
+                    ctypes.memset(addr + n, 0, size - n)
+                    ovl = free_ovl.popleft()
+                    ovl.Offset     = offset & 0xFFFFFFFF
+                    ovl.OffsetHigh = offset >> 32
+                    ok = k32.WriteFile(handle, addr, size, None,
+                                       ctypes.byref(ovl))
+                    if not ok:
+                        err = ctypes.get_last_error()
+                        if err != ERROR_IO_PENDING:
+                            free_ovl.append(ovl)
+                            log.error(f"WriteFile failed: error {err}")
+                            raise OSError(_win_err(err))
+                    inflight.append((ovl, io_view, n, size))
+                    # HasOverlappedIoCompleted(): Internal leaves STATUS_PENDING.
+                    while inflight and (not free_ovl or
+                                        inflight[0][0].Internal != STATUS_PENDING):
+                        retire()
+                while inflight:
+                    retire()
+            finally:
+                # Never free a buffer the driver may still be reading from.
+                if inflight:
+                    k32.CancelIoEx(handle, None)
+                    for ovl, *_ in inflight:
+                        k32.GetOverlappedResult(handle, ctypes.byref(ovl),
+                                                ctypes.byref(wintypes.DWORD(0)),
+                                                True)
         log.info(f"Write complete: {written_total} bytes")
+        return written_total
     finally:
         k32.CloseHandle(handle)
+        for ev in events:
+            k32.CloseHandle(ev)
+        for addr in bufs:
+            k32.VirtualFree(addr, 0, MEM_RELEASE)
         if ps_offline:
             _ps_disk_online(disk_num)
 
 
-def _write_unix(image_path, device_path, progress_cb, cancel_event):
+def _write_unix(src, device_path, progress_cb, cancel_event,
+                chunk_size=WRITE_CHUNK):
+    import fcntl
+
+    # On Linux, O_DIRECT bypasses the page cache: the image is written once and
+    # never read back, so caching it only doubles memory traffic and evicts
+    # useful pages.  It needs a page-aligned buffer (an anonymous mmap is) and
+    # sector-multiple write lengths (_chunk_size guarantees that for all but
+    # the image's last chunk, which goes out through a second, buffered fd).
+    direct  = getattr(os, "O_DIRECT", 0)
+    flags   = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    fd      = None
+    tail_fd = None
+    if direct:
+        try:
+            fd = os.open(device_path, flags | direct, 0o666)
+        except OSError as exc:
+            log.debug(f"O_DIRECT open of {device_path} failed ({exc}); "
+                      f"using buffered writes")
+            direct = 0
+    if fd is None:
+        fd = os.open(device_path, flags, 0o666)
+
     written_total = 0
-    with open(image_path, "rb") as src, \
-         open(device_path, "wb", buffering=0) as dst:
-        while True:
-            if cancel_event.is_set():
-                raise InterruptedError("Cancelled.")
-            chunk = src.read(CHUNK)
-            if not chunk:
-                break
-            dst.write(chunk)
-            written_total += len(chunk)
-            progress_cb(written_total)
-        dst.flush()
-        os.fsync(dst.fileno())
+    # A fixed set of buffers for the whole write: the reader thread fills them
+    # in place with readinto() and os.pwrite() sends views of them, so no
+    # per-chunk bytes objects are made.
+    bufs  = [mmap.mmap(-1, chunk_size) for _ in range(PIPELINE_DEPTH)]
+    views = [memoryview(b) for b in bufs]
+    try:
+        # Up to WRITE_QUEUE_DEPTH positional writes are in flight at once, so
+        # the device queue never drains while Python retires the previous
+        # write.  They complete in any order; progress and buffer release
+        # happen in the order they were issued.
+        with _Prefetcher(src, views, cancel_event) as chunks, \
+             concurrent.futures.ThreadPoolExecutor(WRITE_QUEUE_DEPTH) as pool:
+            inflight = collections.deque()    # (future, view, n, offset)
+            opened_direct = bool(direct)
+            pwrite = _pwrite_direct if opened_direct else _pwrite_all
+
+            def retire():
+                nonlocal written_total, direct
+                fut, view, n, off = inflight.popleft()
+                if not fut.result():
+                    # Some drivers accept the O_DIRECT open but reject the
+                    # writes themselves (EINVAL); finish the image buffered.
+                    if direct:
+                        log.debug(f"O_DIRECT write to {device_path} failed "
+                                  f"(EINVAL); using buffered writes")
+                        fcntl.fcntl(fd, fcntl.F_SETFL,
+                                    fcntl.fcntl(fd, fcntl.F_GETFL) & ~direct)
+                        direct = 0
+                    _pwrite_all(fd, view, n, off)
+                chunks.release(view)
+                written_total += n
+                progress_cb(written_total)
+
+            for view, n, offset in chunks:
+                if cancel_event.is_set():
+                    raise InterruptedError("Cancelled.")
+                if direct and n % SECTOR != 0:
+                    # Short chunk at the end of the image: write it through a
+                    # buffered fd of its own rather than pad past the end of
+                    # the image.  With parallel ranges it often arrives
+                    # first, and the main fd stays O_DIRECT for the rest.
+                    if tail_fd is None:
+                        tail_fd = os.open(device_path, os.O_WRONLY)
+                    fut = pool.submit(_pwrite_all, tail_fd, view, n, offset)
+                else:
+                    fut = pool.submit(pwrite, fd, view, n, offset)
+                inflight.append((fut, view, n, offset))
+                while inflight and (len(inflight) >= WRITE_QUEUE_DEPTH
+                                    or inflight[0][0].done()):
+                    retire()
+            while inflight:
+                retire()
+        if tail_fd is not None:
+            _sync_device(tail_fd)
+        _sync_device(fd)
+    finally:
+        for v in views:
+            v.release()
+        for b in bufs:
+            try:
+                b.close()
+            except BufferError:
+                # The traceback of an error on its way out still holds a
+                # slice of this buffer; leave the mapping to the GC rather
+                # than replace that error with this one.
+                pass
+        if tail_fd is not None:
+            os.close(tail_fd)
+        os.close(fd)
     log.info(f"Write complete: {written_total} bytes")
+    return written_total
+
+
+def _sync_device(fd):
+    """
+    Flush everything written to fd through to the medium.  fdatasync skips the
+    metadata pass a block device doesn't need; on macOS plain fsync stops at
+    the drive's own cache, so F_FULLFSYNC is tried first.  Afterwards the
+    buffered image pages (if O_DIRECT was off) are dropped from the page cache.
+    """
+    import fcntl
+    synced = False
+    if hasattr(fcntl, "F_FULLFSYNC"):
+        try:
+            fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+            synced = True
+        except OSError as exc:
+            log.debug(f"F_FULLFSYNC unsupported ({exc}); using fsync")
+    if not synced and hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    elif not synced:
+        os.fsync(fd)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def _pwrite_all(fd, view, n, offset):
+    """
+    os.pwrite() the first n bytes of view at offset, retrying short writes.
+    Returns n.
+    """
+    done = 0
+    while done < n:
+        done += os.pwrite(fd, view[done:n], offset + done)
+    return n
+
+
+def _pwrite_direct(fd, view, n, offset):
+    """
+    _pwrite_all() for an O_DIRECT fd, returning 0 instead of raising when the
+    driver rejects the write with EINVAL.  A raised error's traceback would
+    hold a slice of view — keeping the caller's mmap exported — for as long
+    as the future holding it lives.
+    """
+    try:
+        return _pwrite_all(fd, view, n, offset)
+    except OSError as exc:
+        if exc.errno != errno.EINVAL:
+            raise
+    return 0
+
+
+_WRITERS = {"Windows": _write_windows}    # everything else → _write_unix
 
 
 def _eject_windows(device_path):
-    """Send IOCTL_STORAGE_EJECT_MEDIA so Windows shows 'safe to remove'."""
+    """
+    Send IOCTL_STORAGE_EJECT_MEDIA so Windows shows 'safe to remove'.
+    First the volumes Windows mounted from the new partition table are locked
+    and dismounted through their own partition handles (a lock on the drive
+    handle would not dismount them), and any removal lock is cleared.
+    """
     try:
-        import ctypes
-        from ctypes import wintypes
+        try:
+            disk_num = int(device_path.replace("\\\\.\\PhysicalDrive", ""))
+        except ValueError:
+            disk_num = -1
+        if disk_num >= 0:
+            _dismount_partitions(disk_num, _partition_numbers(disk_num))
         k32 = _setup_k32()
         GENERIC_READ  = 0x80000000
         GENERIC_WRITE = 0x40000000
@@ -703,46 +1777,97 @@ def _eject_windows(device_path):
         FILE_SHARE_WRITE = 0x2
         OPEN_EXISTING    = 3
         INVALID_HANDLE   = ctypes.c_void_p(-1).value
-        IOCTL_STORAGE_EJECT_MEDIA = 0x2D4808
+        IOCTL_STORAGE_MEDIA_REMOVAL = 0x2D4804
+        IOCTL_STORAGE_EJECT_MEDIA   = 0x2D4808
         h = k32.CreateFileW(device_path, GENERIC_READ | GENERIC_WRITE,
                              FILE_SHARE_READ | FILE_SHARE_WRITE,
                              None, OPEN_EXISTING, 0, None)
-        if h not in (None, INVALID_HANDLE):
+        if h in (None, INVALID_HANDLE):
+            log.warning(f"Eject: could not open {device_path}: "
+                        f"error {ctypes.get_last_error()}")
+            return
+        try:
             br = wintypes.DWORD(0)
-            k32.DeviceIoControl(h, IOCTL_STORAGE_EJECT_MEDIA,
-                                 None, 0, None, 0, ctypes.byref(br), None)
+
+            def _ioctl(code, in_buf=None, in_size=0):
+                return k32.DeviceIoControl(h, code, in_buf, in_size,
+                                           None, 0, ctypes.byref(br), None)
+
+            allow = ctypes.c_ubyte(0)   # PREVENT_MEDIA_REMOVAL { FALSE }
+            ok_r = _ioctl(IOCTL_STORAGE_MEDIA_REMOVAL, ctypes.byref(allow), 1)
+            log.debug(f"Eject: allow removal={ok_r}")
+            if _ioctl(IOCTL_STORAGE_EJECT_MEDIA):
+                log.info("Drive ejected.")
+            else:
+                log.warning(f"Eject refused: error {ctypes.get_last_error()}")
+        finally:
             k32.CloseHandle(h)
-            log.info("Drive ejected.")
     except Exception as exc:
         log.warning(f"Eject failed (non-fatal): {exc}")
 
 
 # ── GUI ───────────────────────────────────────────────────────────────────────
+# ttk styles live in the Tcl interpreter, so they can't be set up at import;
+# this remembers which interpreter has them so theme_use(), which re-walks the
+# theme registry, runs once per Tk root.
+_styled_interp = None
+
+
+def _configure_ttk_style(root):
+    global _styled_interp
+    if _styled_interp is root.tk:
+        return
+    style = ttk.Style(root)
+    style.theme_use("default")
+    style.configure("Nox.Horizontal.TProgressbar",
+                    troughcolor=C_BG3, background=C_ACCENT, thickness=14)
+    _styled_interp = root.tk
+
+
 class App(tk.Tk):
-    def __init__(self):
+    def __init__(self, release_future=None):
         super().__init__()
         self.title("NOXIOM OS INSTALLER")
         self.resizable(False, False)
         self.configure(bg=C_BG)
 
         self._release = None
+        self._release_future = release_future   # fetch started by main()
         self._drives  = []
         self._arch    = tk.StringVar(value="arm64")
         self._status  = tk.StringVar(value="Fetching latest release…")
         self._cancel  = threading.Event()
         self._busy    = False
-
-        self._build_ui()
-        self._check_admin()
-        self.after(50,  self._fetch_release_async)
-        self.after(100, self.refresh_drives)
+        self._refreshing = False    # a drive scan is running
+        self._rescan     = False    # drives changed during that scan
+        # Progress is posted by the install worker — a byte count, or a
+        # (pct, text) tuple for a plain status line — and picked up by _tick
+        # on the Tk thread: one timer instead of an after() callback per chunk.
+        # Attribute assignment is atomic.
+        self._progress_var = tk.DoubleVar(value=0)
+        self._pending      = None
+        self._speed        = SpeedTracker()
+        self._total        = 0      # image bytes of the install in progress
+
+        self._build_ui_core()
+        # Both start worker threads straight away and report back through
+        # after(0, …), so start-up waits on the slower of the two, not both.
+        self._fetch_release_async()
+        self.refresh_drives()
+        self.after(int(PROGRESS_INTERVAL * 1000), self._tick)
+        if SYSTEM == "Linux":
+            # Rescan when a drive comes or goes instead of waiting for Refresh.
+            _watch_linux_drives(lambda: self.after(0, self._drives_changed))
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ── UI construction ──────────────────────────────────────────────────────
-    def _build_ui(self):
-        def sep():
-            tk.Frame(self, bg=C_BORDER, height=1).pack(fill="x")
+    # Only the header and drive list are built before the window first maps;
+    # the progress and button sections follow from idle callbacks, chained so
+    # they still pack in order.
+    def _sep(self):
+        tk.Frame(self, bg=C_BORDER, height=1).pack(fill="x")
 
+    def _build_ui_core(self):
         # Header
         hdr = tk.Frame(self, bg=C_BG2)
         hdr.pack(fill="x")
@@ -751,7 +1876,7 @@ class App(tk.Tk):
         self._ver_lbl = tk.Label(hdr, text="fetching version…",
                                   font=FONT_SMALL, bg=C_BG2, fg=C_FG2)
         self._ver_lbl.pack(side="right", padx=16, pady=10)
-        sep()
+        self._sep()
 
         # Architecture
         arch_frm = tk.Frame(self, bg=C_BG, padx=16, pady=10)
@@ -767,7 +1892,7 @@ class App(tk.Tk):
                            selectcolor=C_BG3,
                            activebackground=C_BG,
                            activeforeground=C_ACCENT).pack(side="left", padx=(0, 24))
-        sep()
+        self._sep()
 
         # Drive list
         drive_hdr = tk.Frame(self, bg=C_BG, padx=16, pady=6)
@@ -803,24 +1928,28 @@ class App(tk.Tk):
                  text="⚠  ALL DATA on the selected drive will be permanently erased.",
                  font=FONT_SMALL, bg=C_BG, fg=C_YELLOW,
                  wraplength=444, justify="left").pack(fill="x", padx=16, pady=(2, 8))
-        sep()
+        self._sep()
+
+        self.geometry("480x610")
+        self.after_idle(self._build_ui_progress)
 
+    def _build_ui_progress(self):
         # Progress
         prog_frm = tk.Frame(self, bg=C_BG, padx=16, pady=8)
         prog_frm.pack(fill="x")
         self._status_lbl = tk.Label(prog_frm, textvariable=self._status,
                                      font=FONT_SMALL, bg=C_BG, fg=C_FG2, anchor="w")
         self._status_lbl.pack(fill="x")
-        style = ttk.Style()
-        style.theme_use("default")
-        style.configure("Nox.Horizontal.TProgressbar",
-                         troughcolor=C_BG3, background=C_ACCENT, thickness=14)
+        _configure_ttk_style(self)
         self._progress = ttk.Progressbar(prog_frm, orient="horizontal",
                                           length=444, mode="determinate",
+                                          variable=self._progress_var,
                                           style="Nox.Horizontal.TProgressbar")
         self._progress.pack(fill="x", pady=(4, 0))
-        sep()
+        self._sep()
+        self.after_idle(self._build_ui_buttons)
 
+    def _build_ui_buttons(self):
         # Buttons
         btn_frm = tk.Frame(self, bg=C_BG, pady=12)
         btn_frm.pack()
@@ -848,8 +1977,7 @@ class App(tk.Tk):
         self._admin_lbl.pack(pady=(0, 2))
         tk.Label(self, text=f"Log: {LOG_PATH}", font=FONT_SMALL,
                  bg=C_BG, fg=C_FG2, wraplength=444).pack(pady=(0, 8))
-
-        self.geometry("480x610")
+        self._check_admin()
 
     # ── Admin check ──────────────────────────────────────────────────────────
     def _check_admin(self):
@@ -867,6 +1995,7 @@ class App(tk.Tk):
             ):
                 return
             self._cancel.set()
+        _ps.close()
         self.destroy()
 
     # ── Release fetch ─────────────────────────────────────────────────────────
@@ -875,28 +2004,57 @@ class App(tk.Tk):
 
     def _fetch_release_worker(self):
         try:
-            release = fetch_release()
+            if self._release_future is not None:
+                release = self._release_future.result()
+            else:
+                release = fetch_release()
             self._release = release
-            tag = release.tag
-            note = " (pre-release)" if release.is_prerelease else " (stable)"
-            def _ok():
-                self._ver_lbl.config(text=f"Latest: {tag}{note}", fg=C_GREEN)
-                self._status.set("Ready. Select a drive and click Install.")
-            self.after(0, _ok)
+            self.after(0, self._on_release, release)
         except Exception as exc:
             log.error(f"fetch_release: {exc}")
-            msg = str(exc)
-            def _fail():
-                self._ver_lbl.config(text="version: unavailable", fg=C_RED)
-                self._status.set(f"Could not fetch release info: {msg}")
-            self.after(0, _fail)
+            self.after(0, self._on_release_error, str(exc))
+
+    def _on_release(self, release):
+        note = " (pre-release)" if release.is_prerelease else " (stable)"
+        self._ver_lbl.config(text=f"Latest: {release.tag}{note}", fg=C_GREEN)
+        self._status.set("Ready. Select a drive and click Install.")
+
+    def _on_release_error(self, msg):
+        self._ver_lbl.config(text="version: unavailable", fg=C_RED)
+        self._status.set(f"Could not fetch release info: {msg}")
 
     # ── Drive refresh ─────────────────────────────────────────────────────────
+    # list_drives() shells out (wmic / PowerShell / diskutil) and can take
+    # seconds, so it runs on a worker thread and the result is handed back to
+    # the Tk thread — same pattern as the release fetch.
     def refresh_drives(self):
-        if self._busy:
+        # A second click while a scan is running would only start another
+        # round of subprocesses whose result replaces the first one's.
+        if self._busy or self._refreshing:
             return
+        self._refreshing = True
+        self._drives = []
+        self._drive_lb.delete(0, tk.END)
+        self._drive_lb.insert(tk.END, "  Scanning drives…")
+        self._no_drive_lbl.config(text="")
+        threading.Thread(target=self._refresh_drives_worker, daemon=True).start()
+
+    def _refresh_drives_worker(self):
+        drives = list_drives()
+        self.after(0, self._populate_drive_list, drives)
+
+    def _drives_changed(self):
+        # The running scan may have read the drives before the change, so
+        # queue another one behind it rather than dropping the event.
+        if self._refreshing:
+            self._rescan = True
+        else:
+            self.refresh_drives()
+
+    def _populate_drive_list(self, drives):
+        self._refreshing = False
+        self._drives = drives
         self._drive_lb.delete(0, tk.END)
-        self._drives = list_drives()
         if self._drives:
             self._no_drive_lbl.config(text="")
             for d in self._drives:
@@ -905,6 +2063,9 @@ class App(tk.Tk):
             self._no_drive_lbl.config(
                 text="No removable drives detected. Insert a drive and click ↺ Refresh."
             )
+        if self._rescan:
+            self._rescan = False
+            self.refresh_drives()
 
     # ── Install ───────────────────────────────────────────────────────────────
     def _on_install(self):
@@ -915,7 +2076,7 @@ class App(tk.Tk):
             return
 
         sel = self._drive_lb.curselection()
-        if not sel:
+        if not sel or sel[0] >= len(self._drives):
             messagebox.showerror("No drive selected", "Please select a target drive.")
             return
 
@@ -954,7 +2115,7 @@ class App(tk.Tk):
         self._install_btn.config(state="disabled")
         self._cancel_btn.config(state="normal")
         self._status_lbl.config(fg=C_FG2)
-        self._progress.configure(value=0)
+        self._progress_var.set(0)
 
         threading.Thread(
             target=self._install_worker,
@@ -969,51 +2130,20 @@ class App(tk.Tk):
 
     # ── Install worker (background thread) ────────────────────────────────────
     def _install_worker(self, drive, url, total_size):
-        tmp_fd, tmp_path = tempfile.mkstemp(suffix=".img")
-        os.close(tmp_fd)
         log.info(f"Install started: drive={drive.path}  url={url}")
 
         try:
-            # Phase 1 — Download (0 → 50 %)
-            speed = SpeedTracker()
-
-            def dl_cb(downloaded):
-                speed.update(downloaded)
-                pct  = (downloaded / total_size * 50) if total_size else 0
-                now  = downloaded / (1024 ** 2)
-                tot  = total_size / (1024 ** 2)
-                spd  = SpeedTracker.fmt_speed(speed.bps())
-                eta  = speed.eta_str(total_size - downloaded)
-                info = f"  ETA {eta}" if eta else ""
-                self.after(0, lambda p=pct, n=now, t=tot:
-                    (self._progress.configure(value=p),
-                     self._status.set(f"Downloading…  {n:.1f} / {t:.1f} MB{spd}{info}")))
-
-            self.after(0, lambda: self._status.set("Starting download…"))
-            download_asset(url, tmp_path, dl_cb, self._cancel)
-
-            # Phase 2 — Write (50 → 100 %)
-            img_size = os.path.getsize(tmp_path)
-            speed2   = SpeedTracker()
-
-            def wr_cb(written):
-                speed2.update(written)
-                pct  = 50 + (written / img_size * 50) if img_size else 50
-                now  = written  / (1024 ** 2)
-                tot  = img_size / (1024 ** 2)
-                spd  = SpeedTracker.fmt_speed(speed2.bps())
-                eta  = speed2.eta_str(img_size - written)
-                info = f"  ETA {eta}" if eta else ""
-                self.after(0, lambda p=pct, n=now, t=tot:
-                    (self._progress.configure(value=p),
-                     self._status.set(f"Writing…  {n:.1f} / {t:.1f} MB{spd}{info}")))
-
-            self.after(0, lambda: self._status.set("Writing to drive…"))
-            write_image(tmp_path, drive.path, wr_cb, self._cancel)
+            # Download and write in one pass (0 → 100 %)
+            self._speed   = SpeedTracker()
+            self._total   = total_size
+            self._pending = (0, "Starting download…")
+            written = stream_to_device(url, drive.path, total_size,
+                                       self._post_written, self._cancel)
+            log.info(f"Image installed: {written} bytes → {drive.path}")
 
             # Eject (Windows only)
-            if platform.system() == "Windows":
-                self.after(0, lambda: self._status.set("Ejecting drive…"))
+            if SYSTEM == "Windows":
+                self._pending = (100, "Ejecting drive…")
                 _eject_windows(drive.path)
 
             self.after(0, self._on_done)
@@ -1022,19 +2152,46 @@ class App(tk.Tk):
             log.info("Installation cancelled by user.")
             self.after(0, self._on_cancelled)
         except Exception as exc:
-            msg = str(exc)
             log.error(f"Installation failed: {exc}")
-            self.after(0, lambda m=msg: self._on_error(m))
+            self.after(0, self._on_error, str(exc))
         finally:
             self._busy = False
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
+            _ps.close()     # started again on demand by the next install
+
+    def _post_written(self, written):
+        # Called by the writer after every chunk: just record the count.  The
+        # speed, ETA and status text are worked out by _tick, once per
+        # PROGRESS_INTERVAL rather than once per chunk.
+        self._pending = written
+
+    # ── Progress pump (Tk thread) ─────────────────────────────────────────────
+    def _tick(self):
+        state, self._pending = self._pending, None
+        if isinstance(state, int):
+            state = self._progress_state(state)
+        if state is not None:
+            pct, text = state
+            self._progress_var.set(pct)
+            self._status.set(text)
+        self.after(int(PROGRESS_INTERVAL * 1000), self._tick)
+
+    def _progress_state(self, written):
+        total = self._total
+        self._speed.update(written)
+        pct  = (written / total * 100) if total else 0
+        now  = written * _INV_MIB
+        tot  = total * _INV_MIB
+        spd  = SpeedTracker.fmt_speed(self._speed.bps())
+        eta  = self._speed.eta_str(total - written)
+        info = f"  ETA {eta}" if eta else ""
+        return pct, f"Installing…  {now:.1f} / {tot:.1f} MB{spd}{info}"
 
     # ── Outcome handlers ──────────────────────────────────────────────────────
+    # Each drops any progress still pending so a late _tick can't overwrite
+    # the final status.
     def _on_done(self):
-        self._progress.configure(value=100)
+        self._pending = None
+        self._progress_var.set(100)
         self._status.set("Done! Safe to remove the drive.")
         self._status_lbl.config(fg=C_GREEN)
         self._install_btn.config(state="normal")
@@ -1045,13 +2202,15 @@ class App(tk.Tk):
             "Insert it into your target device and power on.")
 
     def _on_cancelled(self):
-        self._progress.configure(value=0)
+        self._pending = None
+        self._progress_var.set(0)
         self._status.set("Cancelled.")
         self._status_lbl.config(fg=C_YELLOW)
         self._install_btn.config(state="normal")
         self._cancel_btn.config(state="disabled")
 
     def _on_error(self, msg):
+        self._pending = None
         self._status.set(f"Error: {msg}")
         self._status_lbl.config(fg=C_RED)
         self._install_btn.config(state="normal")
@@ -1061,8 +2220,21 @@ class App(tk.Tk):
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
+def _start_release_fetch():
+    """Run fetch_release() on a background thread; returns its Future."""
+    future = concurrent.futures.Future()
+
+    def run():
+        try:
+            future.set_result(fetch_release())
+        except Exception as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
 def _relaunch_as_admin_windows():
-    import ctypes
     rc = ctypes.windll.user32.MessageBoxW(
         0,
         "This installer needs Administrator privileges to write to drives.\n\n"
@@ -1079,11 +2251,14 @@ def _relaunch_as_admin_windows():
 
 
 def main():
-    log.info(f"Installer started.  Platform: {platform.system()} {platform.version()}")
-    if platform.system() == "Windows" and not is_admin():
+    log.info(f"Installer started.  Platform: {SYSTEM} {platform.version()}")
+    if SYSTEM == "Windows" and not is_admin():
         _relaunch_as_admin_windows()
         return
-    app = App()
+    # Start the GitHub round trip before Tk loads Tcl and builds the window,
+    # so the two overlap instead of running back to back.
+    release_future = _start_release_fetch()
+    app = App(release_future)
     app.mainloop()
     log.info("Installer closed.")
 